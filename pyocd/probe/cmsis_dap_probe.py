@@ -394,11 +394,14 @@ class CMSISDAPProbe(DebugProbe):
         assert self.session
         TRACE.debug("trace: reset")
 
+        hold_time = self.session.options.get('reset.hold_time')
+        post_delay = self.session.options.get('reset.post_delay')
+
         try:
             self._link.assert_reset(True)
-            sleep(self.session.options.get('reset.hold_time'))
+            sleep(hold_time)
             self._link.assert_reset(False)
-            sleep(self.session.options.get('reset.post_delay'))
+            sleep(post_delay)
         except DAPAccess.Error as exc:
             raise self._convert_exception(exc) from exc
 
@@ -292,11 +292,13 @@ class JLinkProbe(DebugProbe):
 
     def reset(self):
         assert self.session
+        hold_time = self.session.options.get('reset.hold_time')
+        post_delay = self.session.options.get('reset.post_delay')
         try:
             self._link.set_reset_pin_low()
-            sleep(self.session.options.get('reset.hold_time'))
+            sleep(hold_time)
             self._link.set_reset_pin_high()
-            sleep(self.session.options.get('reset.post_delay'))
+            sleep(post_delay)
         except JLinkException as exc:
             raise self._convert_exception(exc) from exc
 
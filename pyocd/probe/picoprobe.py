@@ -166,18 +166,20 @@ class PicoLink(object):
         remaining -= self.PKT_HDR_LEN
         offset = self.PKT_HDR_LEN
         result = []
+        # Slice through a memoryview so values are decoded in place, without copying the buffer
+        bits = memoryview(self._bits)
         # Loop over the received data, creating a list of ints
         while remaining > 0:
             # Check for a real read header
-            if self._bits[offset+1] != self.PROBE_READ_BITS:
+            if bits[offset+1] != self.PROBE_READ_BITS:
                 # Something went wrong: wrong command in received header
                 # Possible sign we are misaligned
                 raise exceptions.ProbeError('Wrong header received from %s')
             # Get the bytes count for the operation
             # The receiver must know how many bits they are interested in!
-            count = (int.from_bytes(self._bits[offset + 2:offset + 6], 'little') + 7) // 8
+            count = (int.from_bytes(bits[offset + 2:offset + 6], 'little') + 7) // 8
             offset += self.CMD_HDR_LEN
-            result.append(int.from_bytes(self._bits[offset:offset + count], 'little'))
+            result.append(int.from_bytes(bits[offset:offset + count], 'little'))
             offset += count
             remaining -= self.CMD_HDR_LEN + count
         return result
@@ -351,6 +353,9 @@ class Picoprobe(DebugProbe):
         self._is_open = False
         self._unique_id = self._link.get_unique_id()
         self._reset = False
+        # SWD frequency in kHz: last value sent to the probe and value pending until open()
+        self._clock = None
+        self._pending_clock = None
 
     @ property
     def description(self):
@@ -386,10 +391,19 @@ class Picoprobe(DebugProbe):
         return {DebugProbe.Capability.SWJ_SEQUENCE, DebugProbe.Capability.SWD_SEQUENCE}
 
     def open(self):
+        if self._is_open:
+            return
         self._link.open()
         self._is_open = True
+        # The probe may have been replugged, so forget the last clock sent
+        self._clock = None
+        if self._pending_clock is not None:
+            self._set_swd_frequency(self._pending_clock)
+            self._pending_clock = None
 
     def close(self):
+        if not self._is_open:
+            return
         self._link.close()
         self._is_open = False
 
@@ -442,17 +456,30 @@ class Picoprobe(DebugProbe):
         # Init lengths to pack and cmd queue
         reads_lengths = []
         self._link.start_queue()
+        # Consecutive output sequences are merged into a single write command
+        write_value = 0
+        write_bits = 0
         # Take each sequence 'seq' in sequences
         for seq in sequences:
             if len(seq) == 1:
+                # Queue any pending output bits before the read
+                if write_bits:
+                    self._link.q_write_bits(write_value, write_bits)
+                    write_value = 0
+                    write_bits = 0
                 bits = seq[0]
                 self._link.q_read_bits(bits)
                 reads_lengths.append((bits + 7) // 8)
             elif len(seq) == 2:
-                self._link.q_write_bits(seq[1], seq[0])
+                bits = seq[0]
+                write_value |= (seq[1] & ((1 << bits) - 1)) << write_bits
+                write_bits += bits
             else:
                 # Ignore malformed entry, raise or return failure? Ignore for the moment.
                 pass
+        # Queue the trailing output bits, if any
+        if write_bits:
+            self._link.q_write_bits(write_value, write_bits)
         # Check if some read were queued
         if len(reads_lengths) == 0:
             # Just execute the queue
@@ -464,16 +491,26 @@ class Picoprobe(DebugProbe):
             return (0, [v.to_bytes(l, 'little') for v, l in zip(reads, reads_lengths)])
 
     def disconnect(self):
+        # Drop the option subscription made in connect(), so that reconnecting doesn't stack callbacks
+        self.session.options.unsubscribe(self._change_options, [self.SAFESWD_OPTION])
         self._is_connected = False
 
     def set_clock(self, frequency):
-        self._link.set_swd_frequency(int(frequency) // 1000)
+        khz = int(frequency) // 1000
+        if not self._is_open:
+            # Defer until the probe is opened
+            self._pending_clock = khz
+        else:
+            self._set_swd_frequency(khz)
 
     def reset(self):
+        # Look up the delays first so the reset pulse width is not stretched by option lookups
+        hold_time = self.session.options.get('reset.hold_time')
+        post_delay = self.session.options.get('reset.post_delay')
         self.assert_reset(True)
-        sleep(self.session.options.get('reset.hold_time'))
+        sleep(hold_time)
         self.assert_reset(False)
-        sleep(self.session.options.get('reset.post_delay'))
+        sleep(post_delay)
 
     def assert_reset(self, asserted):
         self._link.assert_target_reset(asserted)
@@ -531,6 +568,8 @@ class Picoprobe(DebugProbe):
         # Theoretical maximum for the Picoprobe internal 8 kB buffer is ~454
         # Raising the chunk size brings no great benefit, though.
         reads = []
+        # The command byte is the same for every read, build it only once
+        cmd = self._build_swd_command(self.READ, self.AP, addr)
         while count > 0:
             chunk = 256 if count > 256 else count
             count -= chunk
@@ -539,7 +578,7 @@ class Picoprobe(DebugProbe):
             # Queue reads for 1 old value plus count - 1 new values
             for _ in range(chunk):
                 # Queue read command
-                self._swd_command(self.READ, self.AP, addr)
+                self._q_swd_command(cmd, self.READ)
                 # Queue read value + parity + TrN
                 self._link.q_read_bits(32 + 1 + 1)
 
@@ -573,13 +612,15 @@ class Picoprobe(DebugProbe):
         acks = []
         left = len(values)
         done = 0
+        # The command byte is the same for every write, build it only once
+        cmd = self._build_swd_command(self.WRITE, self.AP, addr)
         # Use 256 chunks. Max is about 340.
         while left > 0:
             chunk = 256 if left > 256 else left
             self._link.start_queue()
             for value in values[done:done+chunk]:
                 # Queue write command
-                self._swd_command(self.WRITE, self.AP, addr)
+                self._q_swd_command(cmd, self.WRITE)
                 # Prepare the write buffer
                 value |= parity32_high(value)
                 # Send the value: 32 (data) + 1 (parity) bits (no Trn needed)
@@ -635,12 +676,25 @@ class Picoprobe(DebugProbe):
         self._link.q_write_bits(value, 32 + 1 + 3)
         self._link.flush_queue()
 
+    def _set_swd_frequency(self, khz):
+        # Skip the USB round trip if the frequency is unchanged
+        if khz != self._clock:
+            self._link.set_swd_frequency(khz)
+            self._clock = khz
+
     def _swd_command(self, RnW, APnDP, addr):
         """@brief Builds and queues an SWD command byte plus an ACK read"""
+        self._q_swd_command(self._build_swd_command(RnW, APnDP, addr), RnW)
+
+    def _build_swd_command(self, RnW, APnDP, addr):
+        """@brief Returns the SWD command byte for an AP/DP access"""
         cmd = (APnDP << 1) + (RnW << 2) + ((addr << 1) & self.SWD_CMD_A32)
         cmd |= parity32_high(cmd) >> (32 - 5)
         cmd |= self.SWD_CMD_START | self.SWD_CMD_STOP | self.SWD_CMD_PARK
+        return cmd
 
+    def _q_swd_command(self, cmd, RnW):
+        """@brief Queues a prebuilt SWD command byte plus an ACK read"""
         # Write the command to the probe
         self._link.q_write_bits(cmd, 8)
         # Queue also ACK reading, plus TrN if needed
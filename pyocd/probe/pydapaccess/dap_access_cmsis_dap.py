@@ -16,7 +16,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import re
 import logging
 import collections
 import threading
@@ -517,15 +516,12 @@ class DAPAccessCMSISDAP(DAPAccessIntf):
     @staticmethod
     def set_args(arg_list):
         # Example: arg_list =['limit_packets=True']
-        arg_pattern = re.compile("([^=]+)=(.*)")
         if arg_list:
             for arg in arg_list:
-                match = arg_pattern.match(arg)
+                attr, sep, val = arg.partition('=')
                 # check if arguments have correct format
-                if match:
-                    attr = match.group(1)
+                if sep and attr:
                     if hasattr(DAPSettings, attr):
-                        val = match.group(2)
                         # convert string to int or bool
                         if val.isdigit():
                             val = int(val)
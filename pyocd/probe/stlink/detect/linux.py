@@ -67,9 +67,8 @@ class StlinkDetectLinuxGeneric(StlinkDetectBase):
         """
         dir = os.path.join("/dev", device_type, "by-id")
         if os.path.isdir(dir):
-            to_ret = dict(
-                self._hex_ids([os.path.join(dir, f) for f in os.listdir(dir)])
-            )
+            with os.scandir(dir) as entries:
+                to_ret = dict(self._hex_ids([entry.path for entry in entries]))
             return to_ret
         else:
             LOG.error(
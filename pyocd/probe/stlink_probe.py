@@ -195,10 +195,12 @@ class StlinkProbe(DebugProbe):
 
     def reset(self):
         assert self.session
+        hold_time = self.session.options.get('reset.hold_time')
+        post_delay = self.session.options.get('reset.post_delay')
         self._link.drive_nreset(True)
-        sleep(self.session.options.get('reset.hold_time'))
+        sleep(hold_time)
         self._link.drive_nreset(False)
-        sleep(self.session.options.get('reset.post_delay'))
+        sleep(post_delay)
 
     def assert_reset(self, asserted):
         self._link.drive_nreset(asserted)
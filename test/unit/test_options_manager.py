@@ -16,9 +16,10 @@
 
 import pytest
 import six
+from importlib_metadata import entry_points
 
 from pyocd.core.options_manager import OptionsManager
-from pyocd.core.options import OPTIONS_INFO
+from pyocd.core.options import (BUILTIN_OPTIONS, OPTIONS_INFO)
 
 @pytest.fixture(scope='function')
 def mgr():
@@ -121,4 +122,13 @@ class TestOptionsManager(object):
         mgr.add_back(layer2)
         assert flag[0] == False
 
+class TestOptionInfo(object):
+    def test_builtin_names_unique(self):
+        names = [oi.name for oi in BUILTIN_OPTIONS]
+        assert len(set(names)) == len(names)
 
+    @pytest.mark.parametrize("group", ['pyocd.probe', 'pyocd.rtos'])
+    def test_plugin_names_unique(self, group):
+        for entry_point in entry_points(group=group):
+            names = [oi.name for oi in entry_point.load()().options]
+            assert len(set(names)) == len(names), entry_point.name